@@ -6,12 +6,22 @@
 #
 #############################################################################
 
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
 try:
     from sonic_platform_base.chassis_base import ChassisBase
+    from sonic_platform_base.sfp_base import SfpBase
     from .helper import APIHelper
-    from .event import SfpEvent
+    from .sfp import Sfp
+    from .fan_drawer import FanDrawer
+    from .psu import Psu
+    from .thermal import Thermal
+    from .eeprom import Tlv, NULL
+    from .component import Component
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
@@ -20,6 +30,7 @@ NUM_PSU = 2
 NUM_THERMAL = 13
 NUM_PORT = 66
 NUM_COMPONENT = 5
+SFP_INIT_WORKERS = 16
 
 HOST_REBOOT_CAUSE_PATH = "/host/reboot-cause/"
 PMON_REBOOT_CAUSE_PATH = "/usr/share/sonic/platform/api_files/reboot-cause/"
@@ -27,9 +38,75 @@ REBOOT_CAUSE_FILE = "reboot-cause.txt"
 PREV_REBOOT_CAUSE_FILE = "previous-reboot-cause.txt"
 SYSLED_FNODE= "/sys/devices/platform/as9817_64_led/led_alarm"
 SYSLED_MODES = {
-    "0" : "STATUS_LED_COLOR_OFF",
-    "10" : "STATUS_LED_COLOR_RED",
+    "0" : sys.intern("STATUS_LED_COLOR_OFF"),
+    "10" : sys.intern("STATUS_LED_COLOR_RED"),
 }
+SYSLED_MODES_INV = {v: k for k, v in SYSLED_MODES.items()}
+
+QSFP_CAGE_TYPE = (SfpBase.SFP_PORT_TYPE_BIT_QSFP | SfpBase.SFP_PORT_TYPE_BIT_QSFP_PLUS |
+                  SfpBase.SFP_PORT_TYPE_BIT_QSFP28 | SfpBase.SFP_PORT_TYPE_BIT_QSFPDD |
+                  SfpBase.SFP_PORT_TYPE_BIT_OSFP)
+SFP_CAGE_TYPE = (SfpBase.SFP_PORT_TYPE_BIT_SFP | SfpBase.SFP_PORT_TYPE_BIT_SFP_PLUS |
+                 SfpBase.SFP_PORT_TYPE_BIT_SFP28)
+
+# Sub-devices built as cls(index) for index in range(num), keyed by the
+# ChassisBase attribute holding them
+LAZY_SUBSYSTEMS = {
+    '_fan_drawer_list': (FanDrawer, NUM_FAN_TRAY),
+    '_psu_list': (Psu, NUM_PSU),
+    '_thermal_list': (Thermal, NUM_THERMAL),
+    '_component_list': (Component, NUM_COMPONENT),
+}
+
+
+@lru_cache(maxsize=None)
+def _is_host():
+    # Whether we run on the host or in a container does not change for
+    # the life of the process, so only probe it once.
+    return APIHelper().is_host()
+
+
+def _read_small(path):
+    # sysfs attributes and the reboot-cause files are tiny; read them with
+    # a single os.read() rather than through a buffered text file object.
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return data.decode(errors='replace').strip() or None
+
+
+def _lazy_property(name, flag, initializer=None):
+    """
+    Returns a property for the 'name' attribute which is built the first
+    time it is read, until 'flag' is set on the instance. It is built by
+    'initializer', or by Chassis._lazy_build() from LAZY_SUBSYSTEMS when no
+    initializer is given. The setter stores the value as-is.
+    """
+    storage = '_lazy' + name
+
+    def getter(self):
+        if not getattr(self, flag, False):
+            # pmon daemons share one Chassis between threads, make sure
+            # only one of them builds the sub-devices
+            with self._lazy_lock:
+                if not getattr(self, flag, False):
+                    if initializer is None:
+                        self._lazy_build(name)
+                    else:
+                        initializer(self)
+                    setattr(self, flag, True)
+        return getattr(self, storage)
+
+    def setter(self, value):
+        setattr(self, storage, value)
+
+    return property(getter, setter)
+
 
 class Chassis(ChassisBase):
     """Platform-specific Chassis class"""
@@ -37,54 +114,67 @@ class Chassis(ChassisBase):
     def __init__(self):
         ChassisBase.__init__(self)
         self._api_helper = APIHelper()
-        self.is_host = self._api_helper.is_host()
+        self.is_host = _is_host()
+
+        reboot_cause_dir = HOST_REBOOT_CAUSE_PATH if self.is_host \
+            else PMON_REBOOT_CAUSE_PATH
+        self._reboot_cause_path = os.path.join(reboot_cause_dir, REBOOT_CAUSE_FILE)
+        self._prev_reboot_cause_path = os.path.join(reboot_cause_dir, PREV_REBOOT_CAUSE_FILE)
+        self._reboot_cause = None
+        self._sfpevent = None
 
         self.config_data = {}
 
-        self.__initialize_fan()
-        self.__initialize_psu()
-        self.__initialize_thermals()
-        self.__initialize_components()
-        self.__initialize_sfp()
-        self.__initialize_eeprom()
+        # Sub-devices are created on first access, see the lazy
+        # properties below. The lock is reentrant since building the fan
+        # list reads the fan drawer list.
+        self._lazy_lock = threading.RLock()
+        self.sfp_module_initialized = False
+        self.fan_module_initialized = False
+        self.fan_drawer_module_initialized = False
+        self.psu_module_initialized = False
+        self.thermal_module_initialized = False
+        self.component_module_initialized = False
+        self.eeprom_module_initialized = False
 
     def __initialize_sfp(self):
-        from sonic_platform.sfp import Sfp
-        intf_name = self._api_helper.get_intf_name()
-        for index in range(NUM_PORT):
-            sfp = Sfp(index, intf_name.get(index + 1, "Unknown"))
-            self._sfp_list.append(sfp)
-        self._sfpevent = SfpEvent(self._sfp_list)
-        self.sfp_module_initialized = True
+        intf_name = self._api_helper.get_intf_name(self.is_host)
+        names = [intf_name.get(index + 1, "Unknown") for index in range(NUM_PORT)]
+        # Each Sfp probes its module EEPROM when created, so build them
+        # concurrently rather than one port after another. This only runs
+        # from the _sfp_list getter with _lazy_lock held; the workers never
+        # touch self and the list is published once the pool is done.
+        with ThreadPoolExecutor(max_workers=SFP_INIT_WORKERS) as executor:
+            sfp_list = list(executor.map(Sfp, range(NUM_PORT), names))
+        self._sfp_list = sfp_list
 
     def __initialize_fan(self):
-        from sonic_platform.fan_drawer import FanDrawer
-        for fant_index in range(NUM_FAN_TRAY):
-            fandrawer = FanDrawer(fant_index)
-            self._fan_drawer_list.append(fandrawer)
-            self._fan_list.extend(fandrawer._fan_list)
-
-    def __initialize_psu(self):
-        from sonic_platform.psu import Psu
-        for index in range(NUM_PSU):
-            psu = Psu(index)
-            self._psu_list.append(psu)
-
-    def __initialize_thermals(self):
-        from sonic_platform.thermal import Thermal
-        for index in range(NUM_THERMAL):
-            thermal = Thermal(index)
-            self._thermal_list.append(thermal)
+        self._fan_list = [fan for fandrawer in self._fan_drawer_list
+                          for fan in fandrawer._fan_list]
 
     def __initialize_eeprom(self):
-        from sonic_platform.eeprom import Tlv
         self._eeprom = Tlv()
 
-    def __initialize_components(self):
-        from sonic_platform.component import Component
-        for index in range(NUM_COMPONENT):
-            component = Component(index)
-            self._component_list.append(component)
+    def _lazy_build(self, name):
+        cls, num = LAZY_SUBSYSTEMS[name]
+        setattr(self, name, [cls(index) for index in range(num)])
+
+    _sfp_list = _lazy_property('_sfp_list', 'sfp_module_initialized',
+                               __initialize_sfp)
+    _fan_list = _lazy_property('_fan_list', 'fan_module_initialized',
+                               __initialize_fan)
+    _fan_drawer_list = _lazy_property('_fan_drawer_list', 'fan_drawer_module_initialized')
+    _psu_list = _lazy_property('_psu_list', 'psu_module_initialized')
+    _thermal_list = _lazy_property('_thermal_list', 'thermal_module_initialized')
+    _component_list = _lazy_property('_component_list', 'component_module_initialized')
+    _eeprom = _lazy_property('_eeprom', 'eeprom_module_initialized',
+                             __initialize_eeprom)
+
+    # The system EEPROM content does not change at runtime, so it is
+    # decoded once and every field is served from the resulting dict.
+    @cached_property
+    def _eeprom_info(self):
+        return self._eeprom.get_eeprom()
 
     def get_name(self):
         """
@@ -92,7 +182,7 @@ class Chassis(ChassisBase):
             Returns:
             string: The name of the device
         """
-        return self._eeprom.get_model()
+        return self._eeprom_info.get('0x21', NULL)
 
     def get_presence(self):
         """
@@ -117,7 +207,7 @@ class Chassis(ChassisBase):
             A string containing the MAC address in the format
             'XX:XX:XX:XX:XX:XX'
         """
-        return self._eeprom.get_mac()
+        return self._eeprom_info.get('0x24', NULL)
 
     def get_model(self):
         """
@@ -125,7 +215,7 @@ class Chassis(ChassisBase):
         Returns:
             string: Model/part number of device
         """
-        return self._eeprom.get_pn()
+        return self._eeprom_info.get('0x22', NULL)
 
     def get_serial(self):
         """
@@ -133,7 +223,7 @@ class Chassis(ChassisBase):
         Returns:
             A string containing the hardware serial number for this chassis.
         """
-        return self._eeprom.get_serial()
+        return self._eeprom_info.get('0x23', NULL)
 
     def get_revision(self):
         """
@@ -141,7 +231,7 @@ class Chassis(ChassisBase):
         Returns:
             A string containing the hardware revision number for this chassis.
         """
-        return self._eeprom.get_revision()
+        return self._eeprom_info.get('0x27', NULL)
 
     def get_system_eeprom_info(self):
         """
@@ -151,7 +241,7 @@ class Chassis(ChassisBase):
             OCP ONIE TlvInfo EEPROM format and values are their corresponding
             values.
         """
-        return self._eeprom.get_eeprom()
+        return self._eeprom_info
 
     def get_reboot_cause(self):
         """
@@ -164,31 +254,30 @@ class Chassis(ChassisBase):
             is "REBOOT_CAUSE_HARDWARE_OTHER", the second string can be used
             to pass a description of the reboot cause.
         """
-        description = 'None'
-
-        reboot_cause_path = (HOST_REBOOT_CAUSE_PATH + REBOOT_CAUSE_FILE) \
-            if self.is_host \
-            else (PMON_REBOOT_CAUSE_PATH + REBOOT_CAUSE_FILE)
-        prev_reboot_cause_path = (HOST_REBOOT_CAUSE_PATH + PREV_REBOOT_CAUSE_FILE) \
-            if self.is_host \
-            else (PMON_REBOOT_CAUSE_PATH + PREV_REBOOT_CAUSE_FILE)
+        # The previous reboot cause cannot change while we are running
+        if self._reboot_cause is not None:
+            return self._reboot_cause
 
-        sw_reboot_cause      = self._api_helper.read_txt_file(reboot_cause_path) or "Unknown"
-        prev_sw_reboot_cause = self._api_helper.read_txt_file(prev_reboot_cause_path) or "Unknown"
+        description = 'None'
 
+        sw_reboot_cause = _read_small(self._reboot_cause_path) or "Unknown"
         if sw_reboot_cause != "Unknown":
-            reboot_cause = self.REBOOT_CAUSE_NON_HARDWARE
             description = sw_reboot_cause
-        elif prev_reboot_cause_path != "Unknown":
-            reboot_cause = self.REBOOT_CAUSE_NON_HARDWARE
-            description = prev_sw_reboot_cause
+        else:
+            # Only fall back to the previous reboot cause when the current
+            # one is not known
+            prev_sw_reboot_cause = _read_small(self._prev_reboot_cause_path) or "Unknown"
+            if prev_sw_reboot_cause != "Unknown":
+                description = prev_sw_reboot_cause
 
-        return (reboot_cause, description)
+        self._reboot_cause = (self.REBOOT_CAUSE_NON_HARDWARE, description)
+        return self._reboot_cause
 
     def get_change_event(self, timeout=0):
         # SFP event
-        if not self.sfp_module_initialized:
-            self.__initialize_sfp()
+        if self._sfpevent is None:
+            from .event import SfpEvent
+            self._sfpevent = SfpEvent(self._sfp_list)
 
         return self._sfpevent.get_sfp_event(timeout)
 
@@ -204,26 +293,15 @@ class Chassis(ChassisBase):
             An object dervied from SfpBase representing the specified sfp
         """
         sfp = None
-        if not self.sfp_module_initialized:
-            self.__initialize_sfp()
-
-        try:
-            # The index will start from 1
+        # The index will start from 1
+        if 1 <= index <= len(self._sfp_list):
             sfp = self._sfp_list[index-1]
-        except IndexError:
-            sys.stderr.write("SFP index {} out of range (1-{})\n".format(
-                             index, len(self._sfp_list)))
+        else:
+            sys.stderr.write(f"SFP index {index} out of range (1-{len(self._sfp_list)})\n")
         return sfp
 
     def get_port_or_cage_type(self, index):
-        from sonic_platform_base.sfp_base import SfpBase
-
-        if index in range(1, 65):
-            return (SfpBase.SFP_PORT_TYPE_BIT_QSFP | SfpBase.SFP_PORT_TYPE_BIT_QSFP_PLUS | 
-                    SfpBase.SFP_PORT_TYPE_BIT_QSFP28 | SfpBase.SFP_PORT_TYPE_BIT_QSFPDD | 
-                    SfpBase.SFP_PORT_TYPE_BIT_OSFP)
-        else:
-            return SfpBase.SFP_PORT_TYPE_BIT_SFP | SfpBase.SFP_PORT_TYPE_BIT_SFP_PLUS | SfpBase.SFP_PORT_TYPE_BIT_SFP28
+        return QSFP_CAGE_TYPE if 1 <= index <= 64 else SFP_CAGE_TYPE
 
     def get_position_in_parent(self):
         """
@@ -246,15 +324,11 @@ class Chassis(ChassisBase):
         return True
 
     def get_status_led(self):
-        val = self._api_helper.read_txt_file(SYSLED_FNODE)
+        val = _read_small(SYSLED_FNODE)
         return SYSLED_MODES[val] if val in SYSLED_MODES else "UNKNOWN"
 
     def set_status_led(self, color):
-        mode = None
-        for key, val in SYSLED_MODES.items():
-            if val == color:
-                mode = key
-                break
+        mode = SYSLED_MODES_INV.get(color)
         if mode is None:
             return False
         else:
@@ -25,8 +25,7 @@ class FanDrawer(FanDrawerBase):
 
     def __initialize_fan_drawer(self):
         from sonic_platform.fan import Fan
-        for i in range(FANS_PER_FANTRAY):
-            self._fan_list.append(Fan(self.fantrayindex, i))
+        self._fan_list = [Fan(self.fantrayindex, i) for i in range(FANS_PER_FANTRAY)]
 
     def get_name(self):
         """
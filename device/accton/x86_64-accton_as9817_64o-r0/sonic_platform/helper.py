@@ -131,17 +131,23 @@ class APIHelper():
             status = False
         return status, result
 
-    def get_intf_name(self):
+    def get_intf_name(self, is_host=None):
         """
         Fetches interface names indexed by port numbers from platform.json file.
 
+        Args:
+        - is_host: Result of is_host() if the caller already knows it,
+          None to probe it here.
+
         Returns:
         - A dictionary with port indices as keys and interface names as values.
           Example: {1: 'Ethernet0', ...}.
         - Returns an empty dictionary on errors or if key not found.
         """
         platform_json_file_path = PMON_PLATFORM_JSON_FILE
-        if self.is_host():
+        if is_host is None:
+            is_host = self.is_host()
+        if is_host:
             platform = "None"
             with open(MACHINE_CONF_FILE, 'r') as file:
                 for line in file:
@@ -49,15 +49,13 @@ class Psu(PsuBase):
 
     def __initialize_fan(self):
         from sonic_platform.fan import Fan
-        for fan_index in range(0, PSU_NUM_FAN[self.index]):
-            fan = Fan(fan_index, is_psu_fan=True, psu_index=self.index)
-            self._fan_list.append(fan)
+        self._fan_list = [Fan(fan_index, is_psu_fan=True, psu_index=self.index)
+                          for fan_index in range(PSU_NUM_FAN[self.index])]
 
     def __initialize_thermal(self):
         from sonic_platform.thermal import Thermal
-        for thermal_id in range(0, THERMAL_COUNT_PER_PSU):
-            thermal = Thermal(thermal_index=thermal_id, is_psu=True, psu_index=self.index)
-            self._thermal_list.append(thermal)
+        self._thermal_list = [Thermal(thermal_index=thermal_id, is_psu=True, psu_index=self.index)
+                              for thermal_id in range(THERMAL_COUNT_PER_PSU)]
 
     def get_voltage(self):
         """